@@ -25,24 +25,102 @@ http://google.github.io/styleguide/pyguide.html
 
 """
 
-from serial import Serial
-from PIL import Image, ImageFile
-from struct import unpack
-from typing import Literal, Dict, List, Any, Callable
-from time import sleep, gmtime, struct_time
+from serial import Serial, SerialException
+from struct import Struct
+from typing import Literal, Dict, List, Tuple, Any, Iterator, \
+    TYPE_CHECKING
+from time import sleep, gmtime, monotonic, struct_time
 from io import BytesIO
-from gzip import decompress
+from contextlib import contextmanager
+from threading import Lock, Event, Thread, current_thread
+from asyncio import to_thread
+from weakref import finalize
+from itertools import islice
+from os.path import isfile, getmtime, dirname, abspath, join, basename, \
+    realpath
+from json import load as load_json, dump as write_json
 
+# PIL and zlib are only needed for screenshots, so are imported within QLCDBM
+# to keep them out of the import time of the module. Likewise numpy is only an
+# optional dependency of Reading.array().
+if TYPE_CHECKING:
+    from PIL import ImageFile
+    import numpy
 
-class Fluke289:
 
-    # Module imports used within the Fluke289 class definition.
-    from os.path import isfile
-    from json import load as load_json
+# The multimeter parameter map, and the software version of the multimeter it
+# was built from, are stored alongside this file.
+_MAP_PATH = join(dirname(abspath(__file__)), "_map.json")
+_MAP_VERSION_PATH = join(dirname(abspath(__file__)), "_map_version.txt")
+
+# Parsed contents of map files, keyed by path and stored alongside the file
+# modification time at which they were read.
+_MAP_CACHE: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+
+
+def _load_map_cached(path: str) -> Dict[str, Any]:
+    """ Load a multimeter parameter map from file, reusing earlier parses.
+
+    Args:
+        path: The location of the json file holding the map.
+
+    Returns:
+        The parsed map, or an empty dict if the file does not exist. If the
+            file has not been modified since it was last read, the previously
+            parsed dict is returned without touching the file contents.
+
+    Raises:
+        None.
+    """
+    if not isfile(path):
+        return {}
+
+    mtime = getmtime(path)
+    cached = _MAP_CACHE.get(path)
+    if (cached is not None) and (cached[0] == mtime):
+        return cached[1]
+
+    with open(path) as f:
+        parsed: Dict[str, Any] = load_json(f)
+
+    # JSON only allows string keys, restore the integer codes of each submap
+    # so lookups can use the decoded integers directly.
+    parsed = {key: {int(code): val for code, val in submap.items()}
+              for key, submap in parsed.items()}
+
+    _MAP_CACHE[path] = (mtime, parsed)
+
+    return parsed
+
+
+class Fluke289:
 
-    # The buttons available to "press" remotely on a Fluke289.
-    _buttons = ("ONOFF", "MINMAX", "UP", "LEFT", "RIGHT", "DOWN", "INFO", "F1",
-                "F2", "F3", "F4", "RANGE", "BACKLIGHT", "HOLD")
+    # The per-instance state, held in slots rather than an instance __dict__.
+    __slots__ = ("_port", "_device", "_id_cache", "_query_cache", "_lock",
+                 "_refcount", "_latest", "_stream_thread", "_stream_stop",
+                 "_qmp_cache", "_map_checked", "_qsavname_all",
+                 "_pipelining", "__weakref__")
+
+    # The buttons available to "press" remotely on a Fluke289, alongside the
+    # precomputed, encoded command that presses each one.
+    _buttons: Dict[str, bytes] = {key: f"PRESS {key}\r".encode() for key in (
+        "ONOFF", "MINMAX", "UP", "LEFT", "RIGHT", "DOWN", "INFO", "F1", "F2",
+        "F3", "F4", "RANGE", "BACKLIGHT", "HOLD")}
+
+    # Precomputed, encoded prefixes of the "MP" commands used by the property
+    # setters, the value being set is appended to these when sending.
+    _mp_prefixes: Dict[str, bytes] = {key: f"MP {key}, ".encode() for key in (
+        "BEEPER", "DIGITS", "RECEVENTTH", "LANG", "RSM", "ACSMOOTH", "PWPOL",
+        "TEMPUNIT", "SI", "LCDCONT", "CONTBEEPOS", "CONTBEEP", "DATEFMT",
+        "TIMEFMT", "DCPOL", "TEMPOS", "NUMFMT", "DBMREF", "CUSDBM", "ABLTO",
+        "HZEDGE", "APOFFTO")}
+
+    # The accepted values (in seconds) of the auto-backlight and auto-poweroff
+    # timeouts, and the accepted LCD contrast levels, which are validated
+    # without reference to the map.
+    _ablto_values = frozenset({0, 300, 600, 900, 1200, 1500, 1800})
+    _apoffto_values = frozenset({0, 900, 1500, 2100, 2700, 3600})
+    _lcdcont_values = frozenset(range(16))
 
     # All the possible map keys within the multimeter I can find, not all of
     # these correspond to "set"able properties, some are maps used in the
@@ -60,10 +138,42 @@ class Fluke289:
         "HZEDGE", "MEMVALS", "DIGITS", "NUMFMT", "DCPOL", "TIMEFMT", "APOFFTO",
         "DATEFMT", "BEEPER", "RECEVENTTH")
 
+    # The multimeter parameter map, loaded from file when the first instance
+    # is created rather than when the module is imported.
     _map: Dict[str, Any] = {}
-    if isfile("_map.json"):
-        with open("_map.json") as f:
-            _map = load_json(f)
+
+    # The set of values held within each submap of _map, used to validate
+    # property settings in _map_check with a single hash lookup. Rebuilt
+    # whenever an instance is created, and refreshed by QEMAP.
+    _map_rev: Dict[str, frozenset] = {}
+
+    # Each submap of _map as a _LookupTable, which raises a ValueError naming
+    # the submap and code for any code the multimeter did not map. Used to
+    # decode the enumerated fields of binary responses, rebuilt alongside
+    # _map_rev.
+    _map_lut: Dict[str, "_LookupTable"] = {}
+
+    # Query prefixes whose responses are fixed for the lifetime of the device
+    # (its identity and the parameter maps), these are cached by query() and
+    # only sent to the multimeter once. Every other query reflects the live
+    # state of the multimeter and is always sent.
+    _immutable_queries = ("ID", "QEMAP ")
+
+    # The time in seconds for which the response to a "QMP" (meter property)
+    # query is reused. The properties only change when set, which clears the
+    # cache, or from the front panel, so a short window collapses repeated
+    # reads (such as a UI refreshing several properties) into one exchange.
+    _qmp_cache_ttl = 0.25
+
+    # The time in seconds to wait for the multimeter to acknowledge one of the
+    # reset commands ("DS", "RI" and "RMP"), which may take longer to carry
+    # out than the 0.5 second timeout of the port allows for.
+    _slow_timeout = 2.0
+
+    # Queries whose responses are binary, and so may contain carriage returns
+    # within the payload, these are read until the port times out. Every
+    # other response is read up to its terminating carriage return.
+    _binary_queries = (b"QDDB", b"QSMR ", b"QRSI ", b"QLCDBM ")
 
     def __init__(self, port: str, remap: bool | None = None):
         """Instantiate an interface with a Fluke 289 multimeter.
@@ -75,7 +185,8 @@ class Fluke289:
             remap [bool, Optional]: A flag to signal if the device parameter
                 dictionary should be recalculated, if left blank the dictionary
                 will only be mapped if it does not yet exist in the same
-                working directory as the Fluke289.py file.
+                working directory as the Fluke289.py file, or if it was
+                mapped from a multimeter with a different software version.
 
         Returns:
             A Fluke289 object, with methods that allow the exploration and
@@ -86,35 +197,76 @@ class Fluke289:
             dictionary.
         """
 
-        if (remap is None):
-            remap = False
-
         # Store the device location.
         self._port = port
         self._device = None
 
+        # The identity of the device is fixed, so the parsed response to the
+        # "ID" query is cached here on first access.
+        self._id_cache: Tuple[str, str, str] | None = None
+
+        # Responses to queries that cannot change during a session, keyed by
+        # the query string, see the _immutable_queries class property.
+        self._query_cache: Dict[str, str] = {}
+
+        # Recent responses to "QMP" queries, keyed by the query string and
+        # stored alongside the time they were received, see _qmp_cache_ttl.
+        self._qmp_cache: Dict[str, Tuple[float, str]] = {}
+
+        # Whether the multimeter answers a bare "QSAVNAME" with every save
+        # name at once, unknown (None) until first tried, see QSAVNAME.
+        self._qsavname_all: bool | None = None
+
+        # Whether queries may be queued on the multimeter, this is cleared if
+        # a batch of queued queries fails where the same queries sent one at a
+        # time succeed, see _pipeline.
+        self._pipelining = True
+
+        # Serialises access to the device between threads, see _session.
+        self._lock = Lock()
+
+        # The number of "with" blocks currently holding the device open, so
+        # that nested blocks share the open port, see __enter__ and __exit__.
+        self._refcount = 0
+
+        # The most recent primary measurement polled by the streaming thread,
+        # along with the thread itself and the event used to stop it, see
+        # start_streaming and stop_streaming.
+        self._latest: Tuple[float, str, str] | None = None
+        self._stream_thread: Thread | None = None
+        self._stream_stop = Event()
+
+        # Load the stored map, if it has not been loaded already.
+        if (len(self._map) == 0):
+            Fluke289._map = _load_map_cached(_MAP_PATH)
+
+        # If the user has no preference, remap only when the stored map was
+        # built from a different software version, as the parameter maps are
+        # fixed for a given firmware. Comparing the versions needs the
+        # multimeter, so is left until the map is first used, see _check_map.
+        # Maps stored without a version are kept.
+        self._map_checked = (remap is not None) or \
+            (not isfile(_MAP_VERSION_PATH))
+
         # Map out the device properties, if the map wasn't predefined then we
         # must remap regardless of user preference.
         if remap or (len(self._map) == 0):
-
-            # If remapping, the write_json mechanism must be imported.
-            from json import dump as write_json
-
-            # Blank the class map.
-            Fluke289._map: Dict[str, Any] = {}
-
-            # Re populate the map
-            [self.QEMAP(el) for el in self._map_keys]
-
-            # Write the new map to file, updating the map for the future.
-            with open("_map.json", "w") as f:
-                write_json(Fluke289._map, f, indent=4)
+            self._remap()
+        else:
+            # Index the values of each submap for validating property settings.
+            Fluke289._map_rev = {key: frozenset(submap.values())
+                                 for key, submap in self._map.items()}
+            Fluke289._map_lut = {key: _LookupTable(key, submap)
+                                 for key, submap in self._map.items()}
 
         return None
 
     def __enter__(self) -> Serial:
         """ Context management, called when entering "with" block.
 
+        The port is opened if it is not open already, and then held open
+        until the outermost "with" block is left.
+
         Args:
             self: The Fluke289 instance.
 
@@ -129,27 +281,17 @@ class Fluke289:
                 Serial class, does not show as following a call to the open()
                 method.
         """
+        with self._lock:
+            dev = self._open_device()
+            self._refcount += 1
 
-        if (self._device is None):
-            # Create the device variable.
-            self._device = Serial(self._port, baudrate=115200, timeout=0.5)
-        else:
-            # Ensure the device is a Serial instance, then open it.
-            assert isinstance(self._device, Serial), \
-                "Device present, but is of incorrect type?"
-            self._device.open()
-
-        # Check that the device is open, if it is return it, if not raise an
-        # error as the connection has failed.
-        if self._device.is_open:
-            return self._device
-        else:
-            msg = "Failed to open device at {}."
-            raise ConnectionError(msg.format(self._port))
+        return dev
 
     def __exit__(self, exc_type: Any, exc_value: Any, traceback: Any):
         """ Context management, called when exiting "with" block.
 
+        Leaving the outermost "with" block closes the connection, see close().
+
         Args:
             self: The Fluke289 instance.
 
@@ -170,19 +312,25 @@ class Fluke289:
             # seriously wrong.
             raise RuntimeError("Device missing, unable to close.")
 
-        else:
-            # The device handle exists as expected, so check if it is open, if
-            # so then close it.
-            if (self._device.is_open):
-                self._device.close()
+        # Leave the device open for any enclosing "with" block.
+        with self._lock:
+            self._refcount = max(self._refcount - 1, 0)
+            if (self._refcount > 0):
+                return
 
-        if (self._device.is_open):
-            raise ConnectionError("Failed to close device.")
+        self.close()
 
         return
 
-    def __del__(self):
-        """ Context management, called when deleting the instance.
+    def close(self) -> None:
+        """ Close the connection to the multimeter.
+
+        The port is opened by the first command, and is then held open for
+        later commands rather than being opened and closed around each one.
+        This stops any background streaming and closes the port, regardless
+        of any "with" blocks still holding it open. The port is reopened by
+        the next command, so the instance remains usable. The port is also
+        closed once the instance is no longer reachable.
 
         Args:
             self: The Fluke289 instance.
@@ -191,13 +339,13 @@ class Fluke289:
             None.
 
         Raises:
-            None.
+            Connection error, if the port does not show as being closed.
         """
+        self.stop_streaming()
 
-        # Ensuring that if a Serial instance is held within the instance, that
-        # it is closed prior to object deletion.
-        if isinstance(self._device, Serial) and self._device.is_open:
-            self._device.close()
+        with self._lock:
+            self._refcount = 0
+            self._close_device()
 
     @property
     def id(self) -> str:
@@ -207,12 +355,13 @@ class Fluke289:
             self: The Fluke289 instance.
 
         Returns:
-            A string containing the identifier.
+            A string containing the identifier. As the identity of the
+                multimeter is fixed, it is only queried on first access.
 
         Raises:
             None.
         """
-        return self.query("ID")
+        return ",".join(self._get_id())
 
     @property
     def model(self) -> str:
@@ -222,12 +371,13 @@ class Fluke289:
             self: The Fluke289 instance.
 
         Returns:
-            A string containing the name, which should be Fluke 289 or similar.
+            A string containing the name, which should be Fluke 289 or similar,
+                this is only queried from the multimeter on first access.
 
         Raises:
             None.
         """
-        return self.query("ID").split(",")[0]
+        return self._get_id()[0]
 
     @property
     def software_version(self) -> str:
@@ -237,12 +387,13 @@ class Fluke289:
             self: The Fluke289 instance.
 
         Returns:
-            A string containing the software version running on the multimeter.
+            A string containing the software version running on the multimeter,
+                this is only queried from the multimeter on first access.
 
         Raises:
             None.
         """
-        return self.query("ID").split(",")[1]
+        return self._get_id()[1]
 
     @property
     def serial_number(self) -> int:
@@ -252,12 +403,13 @@ class Fluke289:
             self: The Fluke289 instance.
 
         Returns:
-            An integer that is equal to the serial number of the multimeter.
+            An integer that is equal to the serial number of the multimeter,
+                this is only queried from the multimeter on first access.
 
         Raises:
             None.
         """
-        return int(self.query("ID").split(",")[2])
+        return int(self._get_id()[2])
 
     @property
     def mulitmeter_datetime(self) -> struct_time:
@@ -273,7 +425,24 @@ class Fluke289:
         Raises:
             None.
         """
-        return gmtime(int(self.query("QMP CLOCK")))
+        return gmtime(self.multimeter_epoch)
+
+    @property
+    def multimeter_epoch(self) -> int:
+        """ Device time, in seconds since the epoch.
+
+        Args:
+            self: The Fluke289 instance.
+
+        Returns:
+            The current set time on the multimeter, as an integer number of
+            seconds since the epoch, this is convenient for comparing or
+            storing times without converting them to a struct_time.
+
+        Raises:
+            None.
+        """
+        return int(self._raw("CLOCK"))
 
     @property
     def beeper(self) -> str:
@@ -289,7 +458,7 @@ class Fluke289:
         Raises:
             None.
         """
-        return self.query("QMP BEEPER")
+        return self._raw("BEEPER")
 
     @beeper.setter
     def beeper(self, val: Literal["OFF", "ON"]) -> None:
@@ -307,8 +476,7 @@ class Fluke289:
         Raises:
             None.
         """
-        self._map_check(val, "BEEPER")
-        self._command("MP BEEPER, {}".format(val))
+        self._set_mapped("BEEPER", val)
 
     @property
     def digits(self) -> int:
@@ -324,7 +492,7 @@ class Fluke289:
         Raises:
             None.
         """
-        return int(self.query("QMP DIGITS"))
+        return int(self._raw("DIGITS"))
 
     @digits.setter
     def digits(self, val: Literal[4, 5]) -> None:
@@ -342,8 +510,7 @@ class Fluke289:
         Raises:
             None.
         """
-        self._map_check("{}".format(val), "DIGITS")
-        self._command("MP DIGITS, {}".format(val))
+        self._set_mapped("DIGITS", val)
 
     @property
     def company_name(self) -> str:
@@ -377,7 +544,7 @@ class Fluke289:
         Raises:
             None.
         """
-        self._command("MPQ COMPANY, '{}'".format(name))
+        self._command(f"MPQ COMPANY, '{name}'")
 
     @property
     def operator_name(self) -> str:
@@ -412,7 +579,7 @@ class Fluke289:
         Raises:
             None.
         """
-        self._command("MPQ OPERATOR, '{}'".format(name))
+        self._command(f"MPQ OPERATOR, '{name}'")
 
     @property
     def contact_info(self) -> str:
@@ -420,7 +587,7 @@ class Fluke289:
 
     @contact_info.setter
     def contact_info(self, info: str) -> None:
-        self._command("MPQ CONTACT, '{}'".format(info))
+        self._command(f"MPQ CONTACT, '{info}'")
 
     @property
     def site_info(self) -> str:
@@ -428,22 +595,21 @@ class Fluke289:
 
     @site_info.setter
     def site_info(self, site: str) -> None:
-        self._command("MPQ SITE, '{}'".format(site))
+        self._command(f"MPQ SITE, '{site}'")
 
     @property
     def autohold_event_threshold(self):
-        return int(self.query("QMP AHEVENTTH"))
+        return int(self._raw("AHEVENTTH"))
 
     @property
     def recording_event_threshold(self) -> int:
-        return int(self.query("QMP RECEVENTTH"))
+        return int(self._raw("RECEVENTTH"))
 
     @recording_event_threshold.setter
     def recording_event_threshold(
             self,
             val: Literal[0, 1, 4, 5, 10, 15, 20, 25]) -> None:
-        self._map_check("{}".format(val), "RECEVENTTH")
-        self._command("MP RECEVENTTH, {}".format(val))
+        self._set_mapped("RECEVENTTH", val)
 
     @property
     def language(self) -> str:
@@ -460,7 +626,7 @@ class Fluke289:
         Raises:
             None.
         """
-        return self.query("QMP LANG")
+        return self._raw("LANG")
 
     @language.setter
     def language(self,
@@ -481,53 +647,47 @@ class Fluke289:
         Raises:
             None.
         """
-        self._map_check(val, "LANG")
-        self._command("MP LANG, {}".format(val))
+        self._set_mapped("LANG", val)
 
     @property
     def RSM(self) -> str:
-        return self.query("QMP RSM")
+        return self._raw("RSM")
 
     @RSM.setter
     def RSM(self, val: Literal["ON", "OFF"]) -> None:
-        self._map_check(val, "RSM")
-        self._command("MP RSM, {}".format(val))
+        self._set_mapped("RSM", val)
 
     @property
     def ac_smoothing(self) -> str:
-        return self.query("QMP ACSMOOTH")
+        return self._raw("ACSMOOTH")
 
     @ac_smoothing.setter
     def ac_smoothing(self, val: Literal["OFF", "ON"]) -> None:
-        self._map_check(val, "ACSMOOTH")
-        self._command("MP ACSMOOTH, {}".format(val))
+        self._set_mapped("ACSMOOTH", val)
 
     @property
     def pw_polarity(self) -> str:
-        return self.query("QMP PWPOL")
+        return self._raw("PWPOL")
 
     @pw_polarity.setter
     def pw_polarity(self, val: Literal["POS", "NEG"]) -> None:
-        self._map_check(val, "PWPOL")
-        self._command("MP PWPOL, {}".format(val))
+        self._set_mapped("PWPOL", val)
 
     @property
     def temperature_unit(self) -> str:
-        return self.query("QMP TEMPUNIT")
+        return self._raw("TEMPUNIT")
 
     @temperature_unit.setter
     def temperature_unit(self, val: Literal["C", "F"]) -> None:
-        self._map_check(val, "TEMPUNIT")
-        self._command("MP TEMPUNIT, {}".format(val))
+        self._set_mapped("TEMPUNIT", val)
 
     @property
     def SI(self) -> str:
-        return self.query("QMP SI")
+        return self._raw("SI")
 
     @SI.setter
     def SI(self, val: Literal["OFF", "ON"]) -> None:
-        self._map_check(val, "SI")
-        self._command("MP SI, {}".format(val))
+        self._set_mapped("SI", val)
 
     @property
     def lcd_contrast(self) -> int:
@@ -543,7 +703,7 @@ class Fluke289:
         Raises:
             None.
         """
-        return int(self.query("QMP LCDCONT"))
+        return int(self._raw("LCDCONT"))
 
     @lcd_contrast.setter
     def lcd_contrast(
@@ -565,10 +725,10 @@ class Fluke289:
         Raises:
             None.
         """
-        if val not in range(16):
+        if val not in self._lcdcont_values:
             raise ValueError("Error setting LCD contrast, value should be an"
                              + "integer between 0 and 15 inclusive.")
-        self._command("MP LCDCONT, {}".format(val))
+        self._command(self._mp_prefixes["LCDCONT"] + str(val).encode())
 
     @property
     def continuity_beep_config(self) -> str:
@@ -587,7 +747,7 @@ class Fluke289:
         Raises:
             None.
         """
-        return self.query("QMP CONTBEEPOS")
+        return self._raw("CONTBEEPOS")
 
     @continuity_beep_config.setter
     def continuity_beep_config(self, val: Literal["SHORT", "OPEN"]) -> None:
@@ -607,8 +767,7 @@ class Fluke289:
         Raises:
             None.
         """
-        self._map_check(val, "CONTBEEPOS")
-        self._command("MP CONTBEEPOS, {}".format(val))
+        self._set_mapped("CONTBEEPOS", val)
 
     @property
     def continuity_beep(self) -> str:
@@ -624,7 +783,7 @@ class Fluke289:
         Raises:
             None.
         """
-        return self.query("QMP CONTBEEP")
+        return self._raw("CONTBEEP")
 
     @continuity_beep.setter
     def continuity_beep(self, val: Literal["OFF", "ON"]) -> None:
@@ -642,39 +801,35 @@ class Fluke289:
         Raises:
             None.
         """
-        self._map_check(val, "CONTBEEP")
-        self._command("MP CONTBEEP, {}".format(val))
+        self._set_mapped("CONTBEEP", val)
 
     @property
     def date_format(self) -> str:
-        return self.query("QMP DATEFMT")
+        return self._raw("DATEFMT")
 
     @date_format.setter
     def date_format(self, val: Literal["MM_DD", "DD_MM"]) -> None:
-        self._map_check(val, "DATEFMT")
-        self._command("MP DATEFMT, {}".format(val))
+        self._set_mapped("DATEFMT", val)
 
     @property
     def time_format(self) -> int:
-        return int(self.query("QMP TIMEFMT"))
+        return int(self._raw("TIMEFMT"))
 
     @time_format.setter
     def time_format(self, val: Literal[12, 24]) -> None:
-        self._map_check("{}".format(val), "TIMEFMT")
-        self._command("MP TIMEFMT, {}".format(val))
+        self._set_mapped("TIMEFMT", val)
 
     @property
     def DC_polarity(self) -> str:
-        return self.query("QMP DCPOL")
+        return self._raw("DCPOL")
 
     @DC_polarity.setter
     def DC_polarity(self, val: Literal["POS", "NEG"]) -> None:
-        self._map_check(val, "DCPOL")
-        self._command("MP DCPOL, {}".format(val))
+        self._set_mapped("DCPOL", val)
 
     @property
     def temperature_offset(self) -> float:
-        return float(self.query("QMP TEMPOS"))
+        return float(self._raw("TEMPOS"))
 
     @temperature_offset.setter
     def temperature_offset_shift(self, val: float) -> None:
@@ -684,31 +839,29 @@ class Fluke289:
                 + " 100.0 inclusive."
             raise ValueError(msg)
 
-        self._command("MP TEMPOS, {:.1f}".format(val))
+        self._command(self._mp_prefixes["TEMPOS"] + f"{val:.1f}".encode())
 
     @property
     def numeric_format(self) -> str:
-        return self.query("QMP NUMFMT")
+        return self._raw("NUMFMT")
 
     @numeric_format.setter
     def numeric_format(self, val: Literal["POINT", "COMMA"]) -> None:
-        self._map_check(val, "NUMFMT")
-        self._command("MP NUMFMT, {}".format(val))
+        self._set_mapped("NUMFMT", val)
 
     @property
     def decibel_meter_reference(self) -> int:
-        return int(self.query("QMP DBMREF"))
+        return int(self._raw("DBMREF"))
 
     @decibel_meter_reference.setter
     def decibel_meter_reference(
             self,
             val: Literal[0, 4, 8, 16, 25, 32, 50, 75, 600, 1000]) -> None:
-        self._map_check("{}".format(val), "DBMREF")
-        self._command("MP DBMREF, {}".format(val))
+        self._set_mapped("DBMREF", val)
 
     @property
     def custom_decibel_meter_reference(self) -> int:
-        return int(self.query("QMP CUSDBM"))
+        return int(self._raw("CUSDBM"))
 
     @custom_decibel_meter_reference.setter
     def custom_decibel_meter_reference(self, val: int) -> None:
@@ -716,7 +869,7 @@ class Fluke289:
             msg = "Error setting custom_decibel_meter_reference, this should" \
                 + " be an integer between 1 and 1999 inclusive."
             raise ValueError(msg)
-        self._command("MP CUSDBM, {}".format(val))
+        self._command(self._mp_prefixes["CUSDBM"] + str(val).encode())
 
     @property
     def auto_backlight_timeout(self) -> int:
@@ -733,7 +886,7 @@ class Fluke289:
         Raises:
             None.
         """
-        return int(self.query("QMP ABLTO"))
+        return int(self._raw("ABLTO"))
 
     @auto_backlight_timeout.setter
     def auto_backlight_timeout(
@@ -758,23 +911,22 @@ class Fluke289:
         """
 
         # Ensure that a suitable value is passed in.
-        if val not in [0, 300, 600, 900, 1200, 1500, 1800]:
+        if val not in self._ablto_values:
             msg = "Error setting auto backlight timeout, value was {}, " \
                 + "expected one of [0, 300, 600, 900, 1200, 1500, 1800]."
             raise ValueError(msg.format(val))
 
         # If an acceptable value was passed, then send the command to update.
-        self._command("MP ABLTO, {}".format(val))
+        self._command(self._mp_prefixes["ABLTO"] + str(val).encode())
 
     @property
     def hertz_edge_side(self) -> str:
-        return self.query("QMP HZEDGE")
+        return self._raw("HZEDGE")
 
     @hertz_edge_side.setter
     def hertz_edge_side(self,
                         val: Literal["RISING", "FALLING"]) -> None:
-        self._map_check(val, "HZEDGE")
-        self._command("MP HZEDGE, {}".format(val))
+        self._set_mapped("HZEDGE", val)
 
     @property
     def auto_poweroff_timeout(self) -> int:
@@ -792,7 +944,7 @@ class Fluke289:
         Raises:
             None.
         """
-        return int(self.query("QMP APOFFTO"))
+        return int(self._raw("APOFFTO"))
 
     @auto_poweroff_timeout.setter
     def auto_poweroff_timeout(
@@ -819,22 +971,28 @@ class Fluke289:
         """
 
         # Ensure the value is appropriate before sending to the multimeter.
-        if val not in [0, 900, 1500, 2100, 2700, 3600]:
+        if val not in self._apoffto_values:
             msg = "Error setting auto_poweroff_timeout, value given was {}, " \
                 + "but expected one of [0, 900, 1500, 2100, 2700, 3600]."
             raise ValueError(msg.format(val))
 
-        self._command("MP APOFFTO, {}".format(val))
+        self._command(self._mp_prefixes["APOFFTO"] + str(val).encode())
 
     @property
     def primary_value(self) -> float:
-        return float(self.primary_measurement()["value"])
+        return self._primary_triple()[0]
 
     def query(self, query: str | bytes) -> str:
         """ Wrapper method for passing a query to the mumtimeter, this method
         interprets a successful response from the multimeter as an ascii
         formatted string that must be decoded and returned.
 
+        Responses to the queries listed in the _immutable_queries class
+        property are cached on the instance and returned without contacting
+        the multimeter on subsequent calls. Responses to "QMP" queries are
+        likewise reused for _qmp_cache_ttl seconds, or until a command that
+        may change them is sent.
+
         Args:
             self: The Fluke289 instance.
 
@@ -848,7 +1006,27 @@ class Fluke289:
         Raises:
             None.
         """
-        return self._command(query).decode()
+        key = query if isinstance(query, str) else query.decode("ascii")
+
+        cached = self._query_cache.get(key)
+        if cached is not None:
+            return cached
+
+        is_qmp = key.startswith("QMP ")
+        if is_qmp:
+            recent = self._qmp_cache.get(key)
+            if (recent is not None) and \
+                    (monotonic() - recent[0] < self._qmp_cache_ttl):
+                return recent[1]
+
+        response = self._command(query).decode("ascii")
+
+        if key.startswith(self._immutable_queries):
+            self._query_cache[key] = response
+        elif is_qmp:
+            self._qmp_cache[key] = (monotonic(), response)
+
+        return response
 
     def defaultSetup(self) -> None:
         """ Default all settings on the multimeter to their defaults.
@@ -862,7 +1040,7 @@ class Fluke289:
         Raises:
             None.
         """
-        self._command("DS")
+        self._command("DS", timeout=self._slow_timeout)
 
     def resetInstrument(self) -> None:
         """ Reset the multimeter.
@@ -876,7 +1054,9 @@ class Fluke289:
         Raises:
             None.
         """
-        self._command("RI")
+        self._command("RI", timeout=self._slow_timeout)
+        self._id_cache = None
+        self._query_cache.clear()
 
     def resetMeterProperties(self) -> None:
         """ Reset all the properties within the multimeter.
@@ -890,13 +1070,66 @@ class Fluke289:
         Raises:
             None.
         """
-        self._command("RMP")
+        self._command("RMP", timeout=self._slow_timeout)
 
     def primary_measurement(self) -> Dict[str, float | str]:
-        response = self.query("QM").split(",")
-        return {"value": float(response[0]),
-                "unit": response[1],
-                "state": response[2]}
+        value, unit, state = self._primary_triple()
+        return {"value": value,
+                "unit": unit,
+                "state": state}
+
+    def start_streaming(self, interval: float = 0.0) -> None:
+        """ Continuously poll the primary measurement in the background.
+
+        While streaming, primary_value and primary_measurement return the most
+        recently polled measurement without waiting on the multimeter. The
+        port is held open for as long as the stream runs, other commands may
+        still be sent in the meantime, and take turns with the polling.
+
+        Args:
+            self: The Fluke289 instance.
+
+            interval: The time in seconds to wait between polls, by default
+                the multimeter is polled as fast as it responds.
+
+        Returns:
+            None.
+
+        Raises:
+            None.
+        """
+        if (self._stream_thread is not None):
+            return
+
+        self._stream_stop.clear()
+        self._stream_thread = Thread(target=self._stream,
+                                     args=(float(interval),),
+                                     daemon=True)
+        self._stream_thread.start()
+
+    def stop_streaming(self) -> None:
+        """ Stop polling the primary measurement in the background.
+
+        Args:
+            self: The Fluke289 instance.
+
+        Returns:
+            None.
+
+        Raises:
+            None.
+        """
+        # The thread clears _stream_thread itself as it ends, so take a local
+        # reference to join on.
+        thread = self._stream_thread
+        if (thread is None):
+            return
+
+        self._stream_stop.set()
+        thread.join()
+        if (self._stream_thread is thread):
+            self._stream_thread = None
+        self._latest = None
 
     def press_button(
             self,
@@ -907,11 +1140,32 @@ class Fluke289:
 
         # Ensure that the button is one of the available options within the
         # multimeter to be pressed.
-        if button not in self._buttons:
+        cmd = self._buttons.get(button)
+        if cmd is None:
             raise ValueError("Invalid choice of button.")
 
         # Send the command to press the button to the multimeter.
-        self._command("PRESS {}".format(button))
+        self._command(cmd)
+
+    def snapshot(self, keys: List[str]) -> Dict[str, str]:
+        """ Read several multimeter properties in a single exchange.
+
+        Reading properties one at a time waits on a full round-trip for each,
+        here the "QMP" queries for all of them are pipelined instead.
+
+        Args:
+            self: The Fluke289 instance.
+
+            keys: The names of the properties, as used in the "QMP" query
+                (e.g. "BEEPER", "DIGITS", "LANG").
+
+        Returns:
+            A dict of the unconverted value of each property, keyed by name.
+
+        Raises:
+            IOError if any of the properties cannot be read.
+        """
+        return dict(zip(keys, self._pipeline([f"QMP {key}" for key in keys])))
 
     def QDDA(self) -> Dict[str, str | List[str] | int | "RangeData" | float |
                            List["Reading"]]:
@@ -936,63 +1190,100 @@ class Fluke289:
         data["min_max_start_time"] = float(out[7])
         data["number_of_modes"] = int(out[8])
 
-        # Trim the response
-        out = out[9:]
+        # Walk an index through the response rather than trimming it, which
+        # would copy the remaining fields each time. The modes follow the
+        # fixed fields, then the number of readings.
+        idx = 9 + data["number_of_modes"]
+        data["modes"] = out[9:idx]
+        data["number_of_readings"] = int(out[idx])
+        idx += 1
 
-        # Work through the modes importing each one.
-        data["modes"] = [out[i] for i in range(data["number_of_modes"])]
+        # Work through the readings, importing each one into a Fluke289Reading
+        # instance. Each reading is nine consecutive fields, which are taken
+        # in turn from a single shared iterator rather than sliced out.
+        fields = islice(out, idx, idx + data["number_of_readings"] * 9)
+        data["readings"] = \
+            [Reading.from_ascii(chunk) for chunk in zip(*[fields] * 9)]
 
-        # Trim the response
-        out = out[data["number_of_modes"]:]
+        return data
 
-        # Read in the number of readings.
-        data["number_of_readings"] = int(out[0])
+    def QDDB(self, as_array: bool = False) -> Dict[
+            str, str | int | struct_time | float | List["Reading"] | Any]:
+        """Query the displayed data in a binary format.
 
-        # Trim the response
-        out = out[1:]
+        Args:
+            self: The Fluke289 instance.
 
-        # Work through the readings, importing each one into a Fluke289Reading
-        # instance.
-        data["readings"] = \
-            [Reading("ascii", out[i*9:(i+1)*9])
-             for i in range(data["number_of_readings"])]
+            as_array: If True the readings are returned as a single NumPy
+                structured array (see Reading.array()) rather than a list of
+                Reading instances, this requires numpy.
 
-        return data
+        Returns:
+            A dict holding the decoded display data and its readings.
 
-    def QDDB(self) -> Dict[str,
-                           str | int | struct_time | float | List["Reading"]]:
-        """Query the displayed data in a binary format."""
+        Raises:
+            ValueError if the response is not of the expected length, or holds
+                a code that is not within the parameter map.
+        """
 
-        # Send the command to the device.
-        res = self._command("QDDB")
+        # Send the command to the device, the header gives the number of
+        # readings that follow, so the response is read in two sized reads
+        # rather than waiting for the port to time out. Each read keeps going
+        # until all of its bytes have arrived, so a long frame that outlasts
+        # a single port timeout is not truncated.
+        with self._session() as dev:
+            dev.write(b"QDDB\r")
+
+            # The status flag and carriage return, a failing response ends
+            # here. Otherwise the "#0" tag and 34 byte header follow.
+            response = _read_exactly(dev, 2)
+            if (response == b"0\r"):
+                response += _read_exactly(dev, 36)
+                if len(response) == 38:
+                    (num_readings,) = _U16.unpack_from(response, 36)
+                    response += _read_exactly(dev, num_readings * 30 + 1)
+
+        res = _parse_response(response)
 
         # Checking that the response is the expected length, each respsonse
         # should have 34 bytes of header, with a number of 30 byte blocks (one
         # 30 byte block per measurement) following thereafter.
-        num_readings = _read_u16(res, 32)
+        if len(res) < _QDDB_HEADER.size:
+            msg = "QDDB parse error, expected at least {} bytes, got {}."
+            raise ValueError(msg.format(_QDDB_HEADER.size, len(res)))
+
+        (prim, sec, autorange, unit, range_max_h, range_max_l, unit_mult,
+         bolt, tsval_h, tsval_l, mode, un1, num_readings) = \
+            _QDDB_HEADER.unpack_from(res, 0)
+
         expected_length = num_readings * 30 + 34
         if len(res) != expected_length:
             msg = "QDDB parse error, expected {} bytes, got {}."
             raise ValueError(msg.format(expected_length, len(res)))
 
-        # Macro defining decoding of map values and instantiation of Readings.
-        mpr: Callable[[str, int], str] = \
-            lambda key, offs: self._map[key][str(_read_u16(res, offs))]
-        val: Callable[[int], Reading] = lambda i: Reading(
-            "binary", res[(34+(i*30)):(64+(i*30))], self._map)
+        # Bind the map lookup tables locally for decoding map values, the
+        # readings are decoded in bulk from a view onto the response so that
+        # no copy is made.
+        self._check_map()
+        lut = self._map_lut
+        mv = memoryview(res)
+        if as_array:
+            readings = Reading.array(mv[34:])
+        else:
+            readings = _read_readings(mv[34:], lut)
 
         return {
-            "primary_function":   mpr("PRIMFUNCTION", 0),
-            "secondary_function": mpr("SECFUNCTION", 2),
-            "autorange":          mpr("AUTORANGE", 4),
-            "unit":               mpr("UNIT", 6),
-            "range_max":          _read_double(res, 8),
-            "unit_mult":          _read_i16(res, 16),
-            "bolt":               mpr("BOLT", 18),
-            "tsval":              gmtime(_read_double(res, 20)),
-            "mode":               mpr("MODE", 28),
-            "un1":                _read_u16(res, 30),
-            "readings":           [val(i) for i in range(num_readings)]
+            "primary_function":   lut["PRIMFUNCTION"][prim],
+            "secondary_function": lut["SECFUNCTION"][sec],
+            "autorange":          lut["AUTORANGE"][autorange],
+            "unit":               lut["UNIT"][unit],
+            "range_max":          _join_double(range_max_h, range_max_l),
+            "unit_mult":          unit_mult,
+            "bolt":               lut["BOLT"][bolt],
+            "tsval":              gmtime(_join_double(tsval_h, tsval_l)),
+            "mode":               lut["MODE"][mode],
+            "un1":                un1,
+            "readings":           readings
         }
 
     def QSRR(self) -> None:
@@ -1075,47 +1366,78 @@ class Fluke289:
 
         raise NotImplementedError("Not yet available.")
 
-    def QSMR(self, idx: int) -> Dict[str, int | str | float | List["Reading"]]:
-        """(QSMR = Query Saved Meter/Measurement(?) Readings)"""
+    def QSMR(self, idx: int, as_array: bool = False, validate: bool = True) \
+            -> Dict[str, int | str | float | List["Reading"] | Any]:
+        """(QSMR = Query Saved Meter/Measurement(?) Readings)
 
-        # Validating that the slot actually is a valid measurement.
-        last_slot = self.QSLS()["nb_measurements"] - 1
-        msg = "idx should be a non-negative integer not larger than {}, " \
-            + "instead it was {}, which is invalid."
-        if (idx < 0) or (idx > last_slot):
-            raise ValueError(msg.format(last_slot, idx))
+        Args:
+            self: The Fluke289 instance.
 
-        # Actually running the command given the slot is a valid one.
-        res = self._command("QSMR {}".format(idx))
+            idx: The saved measurement slot, from zero up to the number of
+                saved measurements (per QSLS) minus one.
 
-        # Macro defining decoding of map values and instantiation of Readings.
-        mpr: Callable[[str, int], str] = \
-            lambda key, offs: self._map[key][str(_read_u16(res, offs))]
-        val: Callable[[int], Reading] = lambda i: Reading(
-            "binary", res[(38+(i*30)):(68+(i*30))], self._map)
+            as_array: If True the measurements are returned as a single NumPy
+                structured array (see Reading.array()) rather than a list of
+                Reading instances, this requires numpy.
 
-        # Alias the number of measurements.
-        num_measurements: int = _read_u16(res, 36)
+            validate: If True the number of saved measurements is queried (via
+                QSLS) to check idx before reading the slot. Callers reading
+                many slots can check the count once themselves and pass False
+                to save a round-trip per slot.
+
+        Returns:
+            A dict holding the decoded saved measurement.
+
+        Raises:
+            ValueError if idx is not a valid slot, or the response holds a
+                code that is not within the parameter map.
+        """
+
+        # Validating that the slot actually is a valid measurement.
+        if validate:
+            last_slot = self.QSLS()["num_measurement"] - 1
+            msg = "idx should be a non-negative integer not larger than {}, " \
+                + "instead it was {}, which is invalid."
+            if (idx < 0) or (idx > last_slot):
+                raise ValueError(msg.format(last_slot, idx))
+
+        # Actually running the command given the slot is a valid one.
+        res = self._command(f"QSMR {idx}")
+
+        # Unpack the fixed 38 byte header of the response in a single call.
+        (sequence_number, un1, prim, sec, autorange, unit, range_max_h,
+         range_max_l, unit_multiplier, bolt, un4, un5, un6, un7, mode, un9,
+         num_measurements) = _QSMR_HEADER.unpack_from(res, 0)
+
+        # Bind the map lookup tables locally for decoding map values, and
+        # decode the readings in bulk from a view onto the response.
+        self._check_map()
+        lut = self._map_lut
+        block = memoryview(res)[38:38 + num_measurements * 30]
+        if as_array:
+            measurements = Reading.array(block)
+        else:
+            measurements = _read_readings(block, lut)
 
         # Parsing the resposnse into a clean output.
         return {
-            "sequence_number":    _read_u16(res, 0),
-            "un1":                _read_u16(res, 2),
-            "primary_function":   mpr("PRIMFUNCTION", 4),
-            "secondary_function": mpr("SECFUNCTION", 6),
-            "auto_range":         mpr("AUTORANGE", 8),
-            "unit":               mpr("UNIT", 10),
-            "range_max":          _read_double(res, 12),
-            "unit_multiplier":    _read_i16(res, 20),
-            "bolt":               mpr("BOLT", 22),
-            "un4":                _read_u16(res, 24),
-            "un5":                _read_u16(res, 26),
-            "un6":                _read_u16(res, 28),
-            "un7":                _read_u16(res, 30),
-            "mode":               mpr("MODE", 32),
-            "un9":                _read_u16(res, 34),
+            "sequence_number":    sequence_number,
+            "un1":                un1,
+            "primary_function":   lut["PRIMFUNCTION"][prim],
+            "secondary_function": lut["SECFUNCTION"][sec],
+            "auto_range":         lut["AUTORANGE"][autorange],
+            "unit":               lut["UNIT"][unit],
+            "range_max":          _join_double(range_max_h, range_max_l),
+            "unit_multiplier":    unit_multiplier,
+            "bolt":               lut["BOLT"][bolt],
+            "un4":                un4,
+            "un5":                un5,
+            "un6":                un6,
+            "un7":                un7,
+            "mode":               lut["MODE"][mode],
+            "un9":                un9,
             "num_measurements":   num_measurements,
-            "measurements":       [val(i) for i in range(num_measurements)],
+            "measurements":       measurements,
             "name":               res[(38 + num_measurements * 30):].decode()
         }
 
@@ -1141,35 +1463,61 @@ class Fluke289:
         if (recording_number is None):
             recording_number = 0
 
-        res = self._command("QRSI {:02d}".format(recording_number))
-
-        mpr: Callable[[str, int], str] = lambda key, offs: \
-            self._map[key][str(_read_u16(res, offs))]
+        # Send the command to the device, reading the fixed 76 byte record by
+        # size rather than waiting for the port to time out, so that a longer
+        # timeout only delays a failed exchange. The rest of the response
+        # runs up to the closing carriage return.
+        with self._session() as dev:
+            dev.write(b"QRSI %02d\r" % recording_number)
+
+            # The status flag and carriage return, a failing response ends
+            # here. Otherwise the "#0" tag and the record follow.
+            response = _read_exactly(dev, 2)
+            if (response == b"0\r"):
+                response += _read_exactly(dev, 2 + _QRSI_RECORD.size)
+                response += dev.read_until(b"\r")
+
+        res = _parse_response(response)
+
+        if len(res) < _QRSI_RECORD.size:
+            msg = "QRSI parse error, expected at least {} bytes, got {}."
+            raise ValueError(msg.format(_QRSI_RECORD.size, len(res)))
+
+        # Unpack the fixed 76 byte layout of the response in a single call.
+        (sequence_number, un2, start_h, start_l, end_h, end_l, interval_h,
+         interval_l, threshold_h, threshold_l, reading_index, un3,
+         number_of_samples, un4, prim, sec, autorange, unit, range_max_h,
+         range_max_l, unit_multiplier, bolt, un8, un9, un10, un11, mode,
+         un12) = _QRSI_RECORD.unpack_from(res, 0)
+
+        # Bind the map lookup tables locally for decoding map values.
+        self._check_map()
+        lut = self._map_lut
 
         return {
-            "sequence_number":    _read_u16(res, 0),
-            "un2":                _read_u16(res, 2),
-            "start_time":         gmtime(_read_double(res, 4)),
-            "end_time":           gmtime(_read_double(res, 12)),
-            "sample_interval":    _read_double(res, 20),
-            "event_threshold":    _read_double(res, 28),
-            "reading_index":      _read_u16(res, 36),
-            "un3":                _read_u16(res, 38),
-            "number_of_samples":  _read_u16(res, 40),
-            "un4":                _read_u16(res, 42),
-            "primary_function":   mpr("PRIMFUNCTION", 44),
-            "secondary_function": mpr('SECFUNCTION', 46),
-            "auto_range":         mpr('AUTORANGE', 48),
-            "unit":               mpr('UNIT', 50),
-            "range_max":          _read_double(res, 52),
-            "unit_multiplier":    _read_i16(res, 60),
-            "bolt":               mpr('BOLT', 62),
-            "un8":                _read_u16(res, 64),
-            "un9":                _read_u16(res, 66),
-            "un10":               _read_u16(res, 68),
-            "un11":               _read_u16(res, 70),
-            "mode":               mpr("MODE", 72),
-            "un12":               _read_u16(res, 74),
+            "sequence_number":    sequence_number,
+            "un2":                un2,
+            "start_time":         gmtime(_join_double(start_h, start_l)),
+            "end_time":           gmtime(_join_double(end_h, end_l)),
+            "sample_interval":    _join_double(interval_h, interval_l),
+            "event_threshold":    _join_double(threshold_h, threshold_l),
+            "reading_index":      reading_index,
+            "un3":                un3,
+            "number_of_samples":  number_of_samples,
+            "un4":                un4,
+            "primary_function":   lut["PRIMFUNCTION"][prim],
+            "secondary_function": lut["SECFUNCTION"][sec],
+            "auto_range":         lut["AUTORANGE"][autorange],
+            "unit":               lut["UNIT"][unit],
+            "range_max":          _join_double(range_max_h, range_max_l),
+            "unit_multiplier":    unit_multiplier,
+            "bolt":               lut["BOLT"][bolt],
+            "un8":                un8,
+            "un9":                un9,
+            "un10":               un10,
+            "un11":               un11,
+            "mode":               lut["MODE"][mode],
+            "un12":               un12,
             }
 
     def QSLS(self) -> Dict[str, int]:
@@ -1196,7 +1544,7 @@ class Fluke289:
                 "num_peak":        int(response[2]),
                 "num_measurement": int(response[3])}
 
-    def QLCDBM(self) -> ImageFile.ImageFile:
+    def QLCDBM(self) -> "ImageFile.ImageFile":
         """ Take a screenshot of the current displayed values on the
         multimeter.
 
@@ -1224,13 +1572,22 @@ class Fluke289:
             None.
         """
 
+        from PIL import Image
+        from zlib import decompressobj, MAX_WBITS
+
         # Request that the screenshot be captured and compressed, returning
-        # the opening 1018 bytes. This command includes a 10 µs delay to
-        # ensure that the command has time to complete as it is definitely not
-        # instantaneous.
-        img: bytes = self._command("QLCDBM 0", 0.01)
+        # the opening 1018 bytes. The capture is definitely not instantaneous,
+        # so the response is waited on for up to two seconds.
+        img: bytes = self._lcd_chunk(0)
         img = img.removeprefix(b"0 #0")
 
+        # The bitmap buffer is compressed (via GZip), so each part of it is
+        # decompressed as it arrives, overlapping decompression with reading
+        # the rest of the buffer. The decompressed parts are held in order and
+        # only joined once the whole buffer has been read.
+        inflater = decompressobj(16 + MAX_WBITS)
+        parts: List[bytes] = [inflater.decompress(img)]
+
         # The maximum returnable information is 1020 bytes minus the number of
         # bytes within "0 " which is two bytes, so the maximum size of the
         # initial returned buffer is 1018 bytes. This is the max regardless of
@@ -1254,12 +1611,15 @@ class Fluke289:
                 # Using the non-zero offset, send the command that requests
                 # the currently stored screenshot buffer from this new offset
                 # forward by a multple of ~1020 bytes.
-                tmp: bytes = self._command("QLCDBM {}".format(offset))
+                tmp: bytes | memoryview = self._lcd_chunk(offset)
 
                 # Remove the opening part of the (already partially cleaned)
                 # response, this ensures that only bitmap buffer is left in
-                # the tmp variable.
-                tmp = tmp.removeprefix("{} #0".format(offset).encode())
+                # the tmp variable. This is done through a memoryview so the
+                # bitmap data is not copied again just to drop the prefix.
+                prefix = b"%d #0" % offset
+                if tmp.startswith(prefix):
+                    tmp = memoryview(tmp)[len(prefix):]
 
                 # Measure the number of bytes within this response, this is
                 # used to identify if more data remains to be read, and if so
@@ -1268,19 +1628,21 @@ class Fluke289:
                 nbytes = len(tmp)
 
                 # Checking if all the response was used, if so there is more
-                # data to be read.
-                more_to_read = (nbytes == 1020 - len("{} ".format(offset)))
+                # data to be read. The "#0" of the prefix is not counted
+                # against the 1020 byte limit.
+                more_to_read = (nbytes == 1020 - (len(prefix) - 2))
 
-                # Appending the current response to the image buffer.
-                img += tmp
+                # Decompressing the current response onto the image parts.
+                parts.append(inflater.decompress(tmp))
 
                 # Moving the offset forward by the correct number of bytes.
                 offset += nbytes
 
-        # Once here, the whole image buffer has been read, and sits within the
-        # "img" variable, however it currently is compressed (via GZip) so we
-        # call decompress() to extract the entire image in its full form.
-        img = decompress(img)
+        # Once here, the whole image buffer has been read and decompressed
+        # into the "parts" list, so the remainder is flushed out and the
+        # entire image is joined in a single pass.
+        parts.append(inflater.flush())
+        img = b"".join(parts)
 
         # Taking the bitmap byte buffer and reading it as an Image, thus
         # translating the screenshot into a sensible format.
@@ -1290,8 +1652,21 @@ class Fluke289:
 
     def QSAVNAME(self) -> List[str]:
         """ Query Save Names """
+        # Ask for all of the names in a single exchange first, remembering if
+        # the firmware rejects this so that it is not tried again. The reply
+        # is only taken if it holds a name for each of the eight slots.
+        if (self._qsavname_all is not False):
+            try:
+                names = self.query("QSAVNAME").split(",")
+            except IOError:
+                names = []
+
+            self._qsavname_all = (len(names) == 8)
+            if self._qsavname_all:
+                return names
+
         # [TODO] WHY range(8) ??????
-        return [self.query("QSAVNAME {}".format(idx)) for idx in range(8)]
+        return self._pipeline([f"QSAVNAME {idx}" for idx in range(8)])
 
     def QEMAP(self,
               map_name: str,
@@ -1317,25 +1692,343 @@ class Fluke289:
         """
 
         # Get the map for this given name.
-        out = self.query("QEMAP {}".format(map_name)).split(",")
+        return self._parse_map(map_name, self.query(f"QEMAP {map_name}"))
 
-        submap_length = int(out.pop(0))
+    def _remap(self) -> None:
+        """ Internal method mapping out the multimeter parameter map.
 
-        if len(out) != submap_length * 2:
+        Args:
+            self: The Fluke289 instance.
+
+        Returns:
+            None, the map is stored within the _map, _map_rev and _map_lut
+                class properties, and written to file alongside the software
+                version of the multimeter it was built from.
+
+        Raises:
+            IOError if any of the QEMAP queries fails.
+        """
+        # Blank the class map.
+        Fluke289._map = {}
+
+        # Re populate the map, pipelining the queries so that they are not
+        # each left waiting on a full round-trip.
+        queries = [f"QEMAP {el}" for el in self._map_keys]
+        for el, response in zip(self._map_keys, self._pipeline(queries)):
+            self._parse_map(el, response)
+
+        # Write the new map to file, updating the map for the future.
+        with open(_MAP_PATH, "w") as f:
+            write_json(Fluke289._map, f, indent=4)
+
+        # Keep the cached parse in step with the file just written.
+        _MAP_CACHE[_MAP_PATH] = (getmtime(_MAP_PATH), Fluke289._map)
+
+        # Record the software version the map was built from.
+        with open(_MAP_VERSION_PATH, "w") as f:
+            f.write(self.software_version)
+
+        self._map_checked = True
+
+    def _check_map(self) -> None:
+        """ Internal method ensuring the map matches the multimeter firmware.
+
+        On first use of the map, the software version the stored map was
+        built from is compared with that of the multimeter, and the map is
+        rebuilt if they differ. Later calls return immediately.
+
+        Args:
+            self: The Fluke289 instance.
+
+        Returns:
+            None.
+
+        Raises:
+            IOError if the multimeter cannot be queried.
+        """
+        if self._map_checked:
+            return
+
+        with open(_MAP_VERSION_PATH) as f:
+            stale = (f.read().strip() != self.software_version)
+
+        if stale:
+            self._remap()
+
+        self._map_checked = True
+
+    def _parse_map(self, map_name: str, response: str) -> Dict[int, str]:
+        """ Internal method parsing a QEMAP response into a submap.
+
+        Args:
+            self: The Fluke289 instance.
+
+            map_name: The name of the map the response was queried for.
+
+            response: The payload of the response to the QEMAP query.
+
+        Returns:
+            The submap, which is also stored within the _map, _map_rev and
+                _map_lut class properties.
+
+        Raises:
+            ValueError if the number of items in the response does not agree
+                with the count it opens with.
+        """
+        out = response.split(",")
+
+        submap_length = int(out[0])
+
+        if len(out) != submap_length * 2 + 1:
             raise ValueError("Error parsing QEMAP {}".format(map_name))
 
-        submap: Dict[int, str] = {}
-        for i in range(submap_length):
-            submap[int(out[2*i])] = out[2*i + 1]
+        # The count is followed by alternating codes and values, these are
+        # paired up in a single pass.
+        submap: Dict[int, str] = dict(zip(map(int, out[1::2]), out[2::2]))
 
-        # [TODO] Check why we are seeing integers as quoted strings in the json
-        # file. Ideally they should be unquoted so they are not re-imported as
-        # strings.
+        # JSON object keys are always strings, so the integer codes come back
+        # quoted from _map.json; _load_map_cached converts them back to ints.
 
         Fluke289._map[map_name] = submap
+        Fluke289._map_rev[map_name] = frozenset(submap.values())
+        Fluke289._map_lut[map_name] = _LookupTable(map_name, submap)
 
         return submap
 
+    def _pipeline(self, queries: List[str], batch: int = 8) -> List[str]:
+        """ Internal method sending several ASCII queries back to back.
+
+        The queries are written to the multimeter in batches, and the
+        responses then read back in order, so the round-trip of each query
+        overlaps those of the rest of its batch rather than each waiting in
+        turn. The batch size keeps the multimeter's receive buffer from being
+        overrun. Should a batch fail, or come back short, its queries are
+        sent again one at a time, and if that succeeds the multimeter is
+        taken not to support queued queries, so every later query is sent
+        one at a time.
+
+        Args:
+            self: The Fluke289 instance.
+
+            queries: The queries to send, these should all give ASCII
+                responses.
+
+            batch: The number of queries to write at a time.
+
+        Returns:
+            The payload of each response, in the order of the queries.
+
+        Raises:
+            IOError if any of the queries fails, see _parse_response().
+        """
+        responses: List[str] = []
+        with self._session() as dev:
+            for i in range(0, len(queries), batch):
+                chunk = queries[i:i + batch]
+
+                if self._pipelining and (len(chunk) > 1):
+                    dev.write("".join([q + "\r" for q in chunk]).encode())
+
+                    try:
+                        responses.extend([_read_ascii(dev) for _ in chunk])
+                        continue
+                    except IOError:
+                        # Discard the responses still outstanding so they
+                        # cannot be mistaken for the responses to the queries
+                        # as they are sent again below.
+                        dev.readall()
+                        queued_failed = True
+                else:
+                    queued_failed = False
+
+                # Send the queries one at a time, any failure now is down to
+                # the query itself so is raised.
+                for q in chunk:
+                    dev.write(q.encode() + b"\r")
+                    responses.append(_read_ascii(dev))
+
+                if queued_failed:
+                    self._pipelining = False
+
+        return responses
+
+    def _lcd_chunk(self, offset: int) -> bytes:
+        """ Internal method reading one chunk of the screenshot buffer.
+
+        The binary chunk may contain carriage returns, so cannot be read up to
+        its terminator, instead its length is known in advance. Every chunk
+        other than the last fills the full 1020 bytes, and so is returned as
+        soon as it arrives, only the last, shorter, chunk is read until the
+        port times out.
+
+        Args:
+            self: The Fluke289 instance.
+
+            offset: The offset into the compressed screenshot buffer, an
+                offset of zero captures a new screenshot.
+
+        Returns:
+            The response payload, holding the "<offset> #0" prefix followed by
+                the chunk of the buffer.
+
+        Raises:
+            IOError if the command fails, see _parse_response().
+        """
+        with self._session() as dev:
+            dev.write(b"QLCDBM %d\r" % offset)
+
+            # The status flag and carriage return, a failing response ends
+            # here. Otherwise the prefix and chunk follow, which together fill
+            # 1020 bytes plus the uncounted "#0", then the carriage return.
+            response = _read_exactly(dev, 2)
+            if (response == b"0\r"):
+                response += _read_exactly(dev, 1023, timeout=dev.timeout)
+
+        return _parse_response(response)
+
+    def _primary_triple(self) -> Tuple[float, str, str]:
+        """ Internal method querying the primary measurement.
+
+        Args:
+            self: The Fluke289 instance.
+
+        Returns:
+            A tuple holding the value, unit, and state of the primary
+                measurement, parsed directly from the "QM" response.
+
+        Raises:
+            ValueError if the response is not a value, unit, and state.
+        """
+        # Serve the latest streamed measurement, if there is one.
+        latest = self._latest
+        if (latest is not None):
+            return latest
+
+        return self._query_primary()
+
+    def _query_primary(self) -> Tuple[float, str, str]:
+        """ Internal method sending the "QM" query to the multimeter.
+
+        Args:
+            self: The Fluke289 instance.
+
+        Returns:
+            A tuple holding the value, unit, and state of the primary
+                measurement, parsed directly from the "QM" response.
+
+        Raises:
+            ValueError if the response is not a value, unit, and state.
+        """
+        value, unit, state = self.query("QM").split(",", 2)
+        return float(value), unit, state
+
+    def _stream(self, interval: float) -> None:
+        """ Internal method run by the streaming thread, see start_streaming.
+
+        Args:
+            self: The Fluke289 instance.
+
+            interval: The time in seconds to wait between polls.
+
+        Returns:
+            None.
+
+        Raises:
+            None, a failed poll is skipped and polling carries on. Should the
+                port fail to open the stream ends, and may then be restarted.
+        """
+        entered = False
+        try:
+            # Hold the port open across polls, so that leaving a "with" block
+            # elsewhere does not close it part way through the stream.
+            self.__enter__()
+            entered = True
+
+            while not self._stream_stop.is_set():
+                # Rebinding the attribute to a new tuple is atomic, so readers
+                # never see a partially updated measurement.
+                try:
+                    self._latest = self._query_primary()
+                except (IOError, ValueError):
+                    pass
+
+                self._stream_stop.wait(interval)
+        finally:
+            # Give up the hold without closing the port, which stays open for
+            # later commands.
+            if entered:
+                with self._lock:
+                    self._refcount = max(self._refcount - 1, 0)
+
+            # Mark the stream as stopped, unless it has already been replaced,
+            # so that start_streaming can start it again.
+            if (self._stream_thread is current_thread()):
+                self._stream_thread = None
+
+    def _get_id(self) -> Tuple[str, str, str]:
+        """ Internal accessor for the cached device identity.
+
+        Args:
+            self: The Fluke289 instance.
+
+        Returns:
+            A tuple holding the model, software version, and serial number of
+                the multimeter, as given in the response to the "ID" query. The
+                query is only sent on first access, as these never change.
+
+        Raises:
+            None.
+        """
+        if (self._id_cache is None):
+            model, software_version, serial_number = \
+                self.query("ID").split(",")
+            self._id_cache = (model, software_version, serial_number)
+
+        return self._id_cache
+
+    def _raw(self, key: str) -> str:
+        """ Internal accessor for the unconverted value of a property.
+
+        Args:
+            self: The Fluke289 instance.
+
+            key: The name of the property, as used in the "QMP" query.
+
+        Returns:
+            The value of the property exactly as returned by the multimeter,
+                the typed properties convert this as appropriate, while it may
+                be passed straight back to _set_mapped without conversion.
+
+        Raises:
+            None.
+        """
+        return self.query("QMP " + key)
+
+    def _set_mapped(self, key: str, val: str | int) -> None:
+        """ Internal method for setting a map validated multimeter property.
+
+        Args:
+            self: The Fluke289 instance.
+
+            key: The name of the property, which is both the "MP" command key
+                and the submap its value is validated against.
+
+            val: The value to be set, given as either a string or an integer,
+                a string (such as one returned by _raw) is sent unchanged.
+
+        Returns:
+            None.
+
+        Raises:
+            ValueError if the value is not allowed for the property, see
+                _map_check.
+        """
+        if not isinstance(val, str):
+            val = str(val)
+
+        self._map_check(val, key)
+        self._command(self._mp_prefixes[key] + val.encode())
+
     def _map_check(self,
                    val: str,
                    submap: str,
@@ -1360,30 +2053,33 @@ class Fluke289:
                 raised, a list of acceptable values should be given within the
                 error that is raised.
         """
-        # Look up the relevant multimeter map within the _map property. Then
-        # list all the acceptable states.
-        valid_vals = self._map[submap].values()
+        self._check_map()
 
-        # Check if the value passed to the checker is an acceptable one, if it
-        # is then return to continue, else raise an error.
-        if val in valid_vals:
+        # Check if the value passed to the checker is an acceptable one, using
+        # the set of acceptable states held for this map within the _map_rev
+        # property, if it is then return to continue, else raise an error.
+        if val in self._map_rev[submap]:
             return
         else:
+            # List all the acceptable states, in the order the multimeter
+            # gives them, from the relevant map within the _map property.
+            valid_vals = list(self._map[submap].values())
+
             msg = "Error setting multimeter property: {}. The value given " \
                 + "was \"{}\", acceptable values include: "
             msg = msg.format(submap, val)
 
             # Listing out and formating acceptable values for the property in
             # question.
-            vv_1 = ["\"{}\", ".format(el) for el in valid_vals]
-            vv_2 = ["and \"{}\".".format(el) for el in valid_vals]
-            vv_1 = "".join(vv_1[:-1])
+            vv_1 = "".join(["\"{}\", ".format(el) for el in valid_vals[:-1]])
+            vv_2 = "and \"{}\".".format(valid_vals[-1])
 
-            raise ValueError(msg + vv_1 + vv_2[-1])
+            raise ValueError(msg + vv_1 + vv_2)
 
     def _command(self,
                  cmd: str | bytes,
                  sleep_time: float | None = None,
+                 timeout: float | None = None,
                  ) -> bytes:
         """ Internal method for communication with the multimeter.
 
@@ -1400,6 +2096,11 @@ class Fluke289:
                 then there may be an issue in interpreting or receiving the
                 response.
 
+            timeout: An optional time in seconds to wait for the response, in
+                place of the timeout of the port, for commands known to take
+                longer to complete. Ascii responses are returned as soon as
+                they arrive, so a longer timeout only delays a failed command.
+
         Returns:
             The response from the device, formatted as a byte array.
 
@@ -1415,158 +2116,706 @@ class Fluke289:
         if sleep_time is not None:
             sleep_time = float(sleep_time)
 
-        # Ensure the command is a string (or a bytes encoded string).
-        if not (isinstance(cmd, bytes) or isinstance(cmd, str)):
+        # Encode a string command, the usual case, then ensure the command
+        # ends with the b"\r" terminator.
+        if isinstance(cmd, str):
+            cmd = cmd.encode()
+        elif not isinstance(cmd, bytes):
             raise ValueError("Command should passed as a string!")
 
-        # If name is a byte stream already, then ensure it ends with the b"\r"
-        # block for termination.
-        if isinstance(cmd, bytes):
-            if not cmd.endswith(b"\r"):
-                cmd += b"\r"
+        if not cmd.endswith(b"\r"):
+            cmd += b"\r"
 
-        # If name is a string, as we would want normally, ensure it ends with
-        # the string "\r", and then encode it to a bytes stream.
-        if isinstance(cmd, str):
-            if not cmd.endswith("\r"):
-                cmd += "\r"
-
-            # Encode it to bytes.
-            cmd = cmd.encode()
+        # Any command other than a query may change the meter properties, so
+        # forget the recent responses to "QMP" queries.
+        if not cmd.startswith((b"Q", b"ID")):
+            self._qmp_cache.clear()
 
         # Open the device, send the command, and then read the response.
-        with self as dev:
-
-            # Sending the command.
-            dev.write(cmd)
-
-            if sleep_time is not None:
-                sleep(sleep_time)
-
-            # Read in the response.
-            response = dev.readall()
-
-        # The first character of the response is a flag describing the
-        # successfulness of the command, zero is all good, if it is zero then
-        # we strip that part away and continue.
-        match response[0:1].decode():
-            case '0':
-                response = response[1:]
-            case '1':
-                raise IOError("Syntax Error.")
-            case '2':
-                raise IOError("Execution error.")
-            case '5':
-                raise IOError("No data available.")
-            case _:
-                raise IOError("Invalid Response.")
-
-        # Strip the carriage returns at the beginning and end of the response,
-        # and the #0 that seems to be tagged (maybe as part of a frame) to
-        # binary responses.
-        response = response.removeprefix(b'\r')
-        response = response.removesuffix(b'\r')
-        response = response.removeprefix(b"#0")
+        with self._session() as dev:
+
+            # Swap in the timeout for this command, restoring the timeout of
+            # the port once the response has been read.
+            port_timeout = dev.timeout
+            if timeout is not None:
+                dev.timeout = timeout
+
+            try:
+                # Sending the command.
+                dev.write(cmd)
+
+                if sleep_time is not None:
+                    sleep(sleep_time)
+
+                # Read in the response. Binary responses have no terminator
+                # that can be relied upon, so are read until the port times
+                # out. Other responses are a status line, followed by a
+                # payload line if the command was a successful query, each
+                # read only until its carriage return arrives rather than for
+                # the whole timeout.
+                if cmd.startswith(self._binary_queries):
+                    response = dev.readall()
+                else:
+                    response = dev.read_until(b"\r")
+                    if (response == b"0\r") and \
+                            cmd.startswith((b"Q", b"ID")):
+                        response += dev.read_until(b"\r")
+            finally:
+                dev.timeout = port_timeout
+
+        return _parse_response(response)
+
+    @contextmanager
+    def _session(self) -> Iterator[Serial]:
+        """ Internal method providing an open device for a single exchange.
 
-        return response
+        Args:
+            self: The Fluke289 instance.
+
+        Returns:
+            A context manager yielding the open Serial instance, holding the
+                instance lock for the duration of the exchange so that the
+                commands and responses of concurrent callers cannot interleave.
+                The port is opened by the first exchange and then left open
+                for those that follow, until close() is called.
+
+        Raises:
+            Connection error, if the port cannot be opened.
+
+            SerialException if the port fails part way through the exchange,
+                the port is reopened before this is raised, so that the next
+                exchange starts afresh.
+        """
+        with self._lock:
+            dev = self._open_device()
+
+            # Discard anything left over from an earlier exchange that timed
+            # out, as it would otherwise be read as this exchange's response.
+            dev.reset_input_buffer()
+
+            try:
+                yield dev
+            except SerialException:
+                self._reopen_device()
+                raise
+
+    def _open_device(self) -> Serial:
+        """ Internal method opening the port, if it is not open already.
+
+        The caller must hold the instance lock.
+
+        Args:
+            self: The Fluke289 instance.
+
+        Returns:
+            The open Serial instance.
+
+        Raises:
+            AssertionError, if the _device property is neither an instance of
+                the Serial class, or None.
+            Connection error, if the port does not show as open.
+        """
+        if (self._device is None):
+            # Create the device variable.
+            self._device = Serial(self._port, baudrate=115200, timeout=0.5)
+            _lower_latency_timer(self._device)
+
+            # Ensure the port is closed once the instance is no longer
+            # reachable, the finalizer holds the Serial instance rather than
+            # this instance, so does not keep it alive.
+            finalize(self, _close_port, self._device)
+        elif not self._device.is_open:
+            # Ensure the device is a Serial instance, then open it.
+            assert isinstance(self._device, Serial), \
+                "Device present, but is of incorrect type?"
+            self._device.open()
+
+        # Check that the device is open, if it is return it, if not raise an
+        # error as the connection has failed.
+        if self._device.is_open:
+            return self._device
+        else:
+            msg = "Failed to open device at {}."
+            raise ConnectionError(msg.format(self._port))
+
+    def _reopen_device(self) -> None:
+        """ Internal method closing and reopening the port after a failure.
+
+        The caller must hold the instance lock.
+
+        Args:
+            self: The Fluke289 instance.
+
+        Returns:
+            None, should the port fail to reopen it is left closed, and is
+                opened again by the next exchange.
+
+        Raises:
+            None.
+        """
+        try:
+            self._device.close()
+            self._device.open()
+        except OSError:
+            pass
+
+    def _close_device(self) -> None:
+        """ Internal method closing the port, if it is open.
+
+        The caller must hold the instance lock.
+
+        Args:
+            self: The Fluke289 instance.
+
+        Returns:
+            None.
+
+        Raises:
+            Connection error, if the port does not show as being closed.
+        """
+        if (self._device is None) or not self._device.is_open:
+            return
+
+        self._device.close()
+
+        if (self._device.is_open):
+            raise ConnectionError("Failed to close device.")
+
+
+class _LookupTable(dict):
+    """ A submap of the multimeter parameter map, used to decode binary fields.
+
+    A code that the multimeter did not map raises a ValueError naming the
+    submap and the code, rather than a bare KeyError. The check only runs on
+    a miss, so mapped codes are looked up at the full speed of a dict.
+    """
+
+    __slots__ = ("name",)
+
+    def __init__(self, name: str, submap: Dict[int, str]):
+        super().__init__(submap)
+        self.name = name
+
+    def __missing__(self, code: int) -> str:
+        msg = "Unknown code {} for multimeter map {}."
+        raise ValueError(msg.format(code, self.name))
+
+
+class AsyncFluke289:
+    """ An asyncio interface with a Fluke 289 multimeter.
+
+    Each exchange with the multimeter is run on a worker thread, leaving the
+    event loop free, so that several multimeters can be driven concurrently.
+    Exchanges with a single multimeter still take turns, as they share its
+    serial port.
+
+    Examples:
+
+        meters = [AsyncFluke289(port) for port in ports]
+        values = await asyncio.gather(*[m.primary_value() for m in meters])
+    """
+
+    __slots__ = ("meter",)
+
+    def __init__(self, port: str, remap: bool | None = None):
+        """Instantiate an asyncio interface with a Fluke 289 multimeter.
+
+        Args:
+            port [str]: The location of the USB serial device that provides the
+                IR interface with the device.
+
+            remap [bool, Optional]: See Fluke289.
+
+        Returns:
+            An AsyncFluke289 object, wrapping a Fluke289 object that remains
+                available as the "meter" attribute.
+
+        Raises:
+            None, though an error may be raised when remapping the parameter
+            dictionary.
+        """
+        self.meter = Fluke289(port, remap=remap)
+
+    async def query(self, query: str | bytes) -> str:
+        """ See Fluke289.query. """
+        return await to_thread(self.meter.query, query)
+
+    async def primary_value(self) -> float:
+        """ See Fluke289.primary_value. """
+        return await to_thread(lambda: self.meter.primary_value)
+
+    async def primary_measurement(self) -> Dict[str, float | str]:
+        """ See Fluke289.primary_measurement. """
+        return await to_thread(self.meter.primary_measurement)
+
+    async def snapshot(self, keys: List[str]) -> Dict[str, str]:
+        """ See Fluke289.snapshot. """
+        return await to_thread(self.meter.snapshot, keys)
+
+    async def QDDA(self) -> Dict[str, Any]:
+        """ See Fluke289.QDDA. """
+        return await to_thread(self.meter.QDDA)
+
+    async def QDDB(self, as_array: bool = False) -> Dict[str, Any]:
+        """ See Fluke289.QDDB. """
+        return await to_thread(self.meter.QDDB, as_array)
+
+    async def QLCDBM(self) -> "ImageFile.ImageFile":
+        """ See Fluke289.QLCDBM. """
+        return await to_thread(self.meter.QLCDBM)
+
+    def close(self) -> None:
+        """ See Fluke289.close. """
+        self.meter.close()
 
 
 class RangeData:
 
+    # The range attributes are fixed, so no per-instance __dict__ is needed.
+    __slots__ = ("auto_range", "base_unit", "range_number", "unit_multiplier")
+
     def __init__(self, data: List[str]):
 
         assert (len(data) == 4), "data is an incorrect length."
 
-        self.auto_range = data[0],
-        self.base_unit = data[1]
-        self.range_number = int(data[2]),
-        self.unit_multiplier = int(data[3])
+        auto_range, base_unit, range_number, unit_multiplier = data
+
+        self.auto_range = auto_range
+        self.base_unit = base_unit
+        self.range_number = int(range_number)
+        self.unit_multiplier = int(unit_multiplier)
 
         return
 
 
 class Reading:
 
+    # Attributes set by either the ascii or binary instantiation cases, the
+    # two cases name the reading identifier and digit count differently. The
+    # time stamp is held as seconds since the epoch, see time_stamp.
+    __slots__ = ("id", "reading_id", "value", "unit", "unit_multiplier",
+                 "decimal_places", "displayed_digits", "display_digits",
+                 "reading_state", "reading_attribute", "_time_stamp_epoch")
+
     def __init__(self,
-                 mode: Literal["binary", "ascii"],
-                 data: List[str] | bytes,
+                 mode: Literal["binary", "ascii", "record"],
+                 data: List[str] | bytes | memoryview | Tuple[Any, ...],
                  map: Dict[str, Any] | None = None):
 
         # Ascii or Binary formatted instantiation cases, handling this by the
         # "mode" argument which is specified by the caller, this choice is
         # mainly made so that assertions on argument type can be used to ensure
         # validity, rather than using the types to infer the parsing desired.
-        # This is a reflection of the type fluidity that python allows.
+        # This is a reflection of the type fluidity that python allows. The
+        # "record" mode takes a binary reading that has already been unpacked
+        # by _READING_RECORD, as produced in bulk by _read_readings(). The
+        # parsing methods within this module call the from_ascii() and
+        # from_record() constructors directly, skipping these checks.
         match mode:
             case "ascii":
 
-                msg = "ascii reading data should be list of strings."
-                assert isinstance(data, list), msg
-                assert all([isinstance(el, str) for el in data]), msg
-                assert (len(data) == 8), "data is an incorrect length."
-
-                self.id = data[0]
-                self.value = float(data[1])
-                self.unit = data[2]
-                self.unit_multiplier = int(data[3])
-                self.decimal_places = int(data[4])
-                self.displayed_digits = int(data[5])
-                self.reading_state = data[6]
-                self.reading_attribute = data[7]
-                self.time_stamp = gmtime(float(data[8]))
-
-            case "binary":
-
-                assert isinstance(data, bytes)
-                assert (len(data) == 30), "data is an incorrect length."
+                # A single guard, the generator short-circuits on the first
+                # non-string field rather than building a list to test.
+                assert (isinstance(data, list) and (len(data) == 9)
+                        and all(isinstance(el, str) for el in data)), \
+                    "ascii reading data should be a list of nine strings."
+
+                self._set_ascii(data)
+
+            case "binary" | "record":
+
                 assert (map is not None), "no map to parse binary reading."
 
-                u16 = _read_u16
-                i16 = _read_i16
-                dbl = _read_double
+                if (mode == "binary"):
+                    assert isinstance(data, (bytes, memoryview))
+                    assert (len(data) == 30), "data is an incorrect length."
 
-                self.reading_id = map["READINGID"][str(u16(data, 0))]
-                self.value = dbl(data, 2)
-                self.unit = map["UNIT"][str(u16(data, 10))]
-                self.unit_multiplier = i16(data, 12)
-                self.decimal_places = u16(data, 14)
-                self.display_digits = u16(data, 16)
-                self.reading_state = map["STATE"][str(u16(data, 18))]
-                self.reading_attribute = map["ATTRIBUTE"][str(u16(data, 20))]
-                self.time_stamp = gmtime(dbl(data, 22))
+                    # Unpack the whole 30 byte block in a single call.
+                    data = _READING_RECORD.unpack_from(data, 0)
+
+                assert isinstance(data, tuple)
+                self._set_record(data, _record_tables(map))
 
         return
 
+    @classmethod
+    def from_ascii(cls, data: List[str] | Tuple[str, ...]) -> "Reading":
+        """ Create a Reading from the nine fields of an ascii reading.
+
+        Args:
+            data: The fields of the reading, as split from a QDDA response.
+
+        Returns:
+            The Reading instance.
+
+        Raises:
+            None.
+        """
+        reading = cls.__new__(cls)
+        reading._set_ascii(data)
+        return reading
+
+    @classmethod
+    def from_record(cls,
+                    data: Tuple[Any, ...],
+                    map: Dict[str, Any],
+                    ) -> "Reading":
+        """ Create a Reading from a binary reading unpacked by _READING_RECORD.
+
+        Args:
+            data: The unpacked fields of the 30 byte binary reading.
+
+            map: The multimeter parameter lookup tables (Fluke289._map_lut)
+                used to interpret the reading.
+
+        Returns:
+            The Reading instance.
+
+        Raises:
+            None.
+        """
+        reading = cls.__new__(cls)
+        reading._set_record(data, _record_tables(map))
+        return reading
+
+    @classmethod
+    def from_records(cls,
+                     records: Iterator[Tuple[Any, ...]],
+                     map: Dict[str, Any],
+                     ) -> List["Reading"]:
+        """ Create Readings from binary readings unpacked by _READING_RECORD.
+
+        Args:
+            records: The unpacked fields of each 30 byte binary reading.
+
+            map: The multimeter parameter lookup tables (Fluke289._map_lut)
+                used to interpret the readings.
+
+        Returns:
+            A list of Reading instances, one per record.
+
+        Raises:
+            None.
+        """
+        # Pick the tables out of the map once for all of the records.
+        tables = _record_tables(map)
+
+        readings: List[Reading] = []
+        for data in records:
+            reading = cls.__new__(cls)
+            reading._set_record(data, tables)
+            readings.append(reading)
+
+        return readings
+
+    @staticmethod
+    def array(block: bytes | memoryview) -> "numpy.ndarray":
+        """ Decode a block of binary readings into a NumPy structured array.
+
+        This is a columnar alternative to building a Reading instance for
+        every reading, which is much faster for large numbers of readings.
+        The enumerated columns (reading_id, unit, reading_state and
+        reading_attribute) hold the raw integer codes, these can be decoded by
+        indexing the matching table within Fluke289._map_lut. The time_stamp
+        column holds seconds since the epoch rather than a struct_time.
+
+        Args:
+            block: The binary readings, back to back, with a length that is a
+                multiple of 30 bytes.
+
+        Returns:
+            A structured array with one element per reading and one field per
+                Reading attribute.
+
+        Raises:
+            ImportError if numpy is not installed.
+            ValueError if the block is not a whole number of readings long.
+        """
+        import numpy as np
+
+        # View the block in place, each double is split into its two 32 bit
+        # words, the first of which holds the most significant half.
+        raw = np.frombuffer(block, dtype=np.dtype([
+            ("reading_id", "<u2"), ("value_h", "<u4"), ("value_l", "<u4"),
+            ("unit", "<u2"), ("unit_multiplier", "<i2"),
+            ("decimal_places", "<u2"), ("display_digits", "<u2"),
+            ("reading_state", "<u2"), ("reading_attribute", "<u2"),
+            ("time_stamp_h", "<u4"), ("time_stamp_l", "<u4")]))
+
+        out = np.empty(len(raw), dtype=np.dtype([
+            ("reading_id", "<u2"), ("value", "<f8"), ("unit", "<u2"),
+            ("unit_multiplier", "<i2"), ("decimal_places", "<u2"),
+            ("display_digits", "<u2"), ("reading_state", "<u2"),
+            ("reading_attribute", "<u2"), ("time_stamp", "<f8")]))
+
+        for name in ("reading_id", "unit", "unit_multiplier",
+                     "decimal_places", "display_digits", "reading_state",
+                     "reading_attribute"):
+            out[name] = raw[name]
+
+        # Re-join the words of each double.
+        for name in ("value", "time_stamp"):
+            bits = (raw[name + "_h"].astype("<u8") << 32) \
+                | raw[name + "_l"].astype("<u8")
+            out[name] = bits.view("<f8")
+
+        return out
+
+    @property
+    def time_stamp(self) -> struct_time:
+        """ The time at which the reading was taken, converted to a
+        struct_time only when accessed.
+        """
+        return gmtime(self._time_stamp_epoch)
+
+    def _set_ascii(self, data: List[str] | Tuple[str, ...]) -> None:
+
+        (reading_id, value, unit, unit_multiplier, decimal_places,
+         displayed_digits, state, attribute, time_stamp) = data
+
+        self.id = reading_id
+        self.value = float(value)
+        self.unit = unit
+        self.unit_multiplier = int(unit_multiplier)
+        self.decimal_places = int(decimal_places)
+        self.displayed_digits = int(displayed_digits)
+        self.reading_state = state
+        self.reading_attribute = attribute
+        self._time_stamp_epoch = float(time_stamp)
+
+    def _set_record(self,
+                    data: Tuple[Any, ...],
+                    tables: Tuple[Any, Any, Any, Any],
+                    ) -> None:
+
+        (reading_id, value_h, value_l, unit, unit_multiplier, decimal_places,
+         display_digits, state, attribute, ts_h, ts_l) = data
+        reading_ids, units, states, attributes = tables
+
+        self.reading_id = reading_ids[reading_id]
+        self.value = _join_double(value_h, value_l)
+        self.unit = units[unit]
+        self.unit_multiplier = unit_multiplier
+        self.decimal_places = decimal_places
+        self.display_digits = display_digits
+        self.reading_state = states[state]
+        self.reading_attribute = attributes[attribute]
+        self._time_stamp_epoch = _join_double(ts_h, ts_l)
+
+
+# Doubles within the binary responses are stored as two little-endian 32 bit
+# words with the most significant word first, so are unpacked as a pair of 4
+# byte fields and re-joined by _join_double(). The values are returned exactly
+# as the multimeter stores them, any rounding for display is left to callers.
+_DOUBLE = Struct("<d")
+
+# Little-endian unsigned 16 bit integers.
+_U16 = Struct("<H")
+
+# The error messages for each failing status flag a response may start with.
+_STATUS_ERRORS: Dict[bytes, str] = {
+    b'1': "Syntax Error.",
+    b'2': "Execution error.",
+    b'5': "No data available.",
+    }
+
+# The 34 byte header of a QDDB response, ending in the number of readings.
+_QDDB_HEADER = Struct("<4H4s4shH4s4s3H")
+
+# The 38 byte header of a QSMR response, ending in the number of readings.
+_QSMR_HEADER = Struct("<6H4s4sh8H")
+
+# The fixed 76 byte layout at the start of a QRSI response.
+_QRSI_RECORD = Struct("<2H4s4s4s4s4s4s4s4s8H4s4sh7H")
+
+# A single 30 byte binary reading, as found in QDDB and QSMR responses.
+_READING_RECORD = Struct("<H4s4sHh4H4s4s")
+
+
+def _parse_response(response: bytes) -> bytes:
+    """ Check the status flag of a raw response and strip its framing.
+
+    Args:
+        response: The raw bytes returned by the multimeter for one command.
+
+    Returns:
+        The payload of the response, formatted as a byte array.
+
+    Raises:
+        IOError if the status flag reports a failure, the details of this
+            error are contained within the message and are defined within
+            Fluke's limited interface documentation.
+    """
+
+    # The first character of the response is a flag describing the
+    # successfulness of the command, zero is all good, if it is zero then we
+    # strip that part away and continue. Any other flag is looked up in
+    # _STATUS_ERRORS for the error message, without decoding the byte.
+    status = response[0:1]
+    if (status != b'0'):
+        raise IOError(_STATUS_ERRORS.get(status, "Invalid Response."))
+
+    # Strip the carriage returns at the beginning and end of the response, and
+    # the #0 that seems to be tagged (maybe as part of a frame) to binary
+    # responses. The bounds of the payload are found first so that it is
+    # copied out in a single slice.
+    start = 2 if response.startswith(b'\r', 1) else 1
+    end = len(response)
+    if response.endswith(b'\r') and (end > start):
+        end -= 1
+    if response.startswith(b"#0", start, end):
+        start += 2
+
+    return response[start:end]
+
+
+def _read_ascii(dev: Serial) -> str:
+    """ Read a single ASCII response from the multimeter.
+
+    Args:
+        dev: The open Serial instance to read from.
+
+    Returns:
+        The payload of the response, decoded as an ascii string.
+
+    Raises:
+        IOError if the response is incomplete, or its status flag reports a
+            failure, see _parse_response().
+    """
+    # A successful response is a status line followed by the payload, a
+    # failure is the status line alone. Either way it ends in a carriage
+    # return, unless the port timed out part way through.
+    response = dev.read_until(b"\r")
+    if (response == b"0\r"):
+        response += dev.read_until(b"\r")
+
+    if not response.endswith(b"\r"):
+        raise IOError("Incomplete response.")
+
+    return _parse_response(response).decode("ascii")
+
+
+def _read_readings(block: bytes | memoryview,
+                   map: Dict[str, Any]) -> List[Reading]:
+    """ Decode a contiguous block of 30 byte binary readings.
+
+    Args:
+        block: The binary readings, back to back, with a length that is a
+            multiple of 30 bytes.
+
+        map: The multimeter parameter lookup tables (Fluke289._map_lut) used
+            to interpret the readings.
+
+    Returns:
+        A list of Reading instances, one per 30 byte block.
+
+    Raises:
+        struct.error if the block is not a whole number of readings long.
+    """
+    return Reading.from_records(_READING_RECORD.iter_unpack(block), map)
+
+
+def _close_port(device: Serial) -> None:
+    """ Close a serial port, if it is open.
+
+    Args:
+        device: The Serial instance to close.
+
+    Returns:
+        None.
+
+    Raises:
+        None.
+    """
+    if device.is_open:
+        device.close()
+
+
+def _lower_latency_timer(dev: Serial) -> None:
+    """ Lower the latency timer of a Linux USB serial adapter to 1 ms.
+
+    USB serial adapters (such as the FTDI chip within the IR cable) hold back
+    received bytes for up to their latency timer, 16 ms by default on Linux,
+    which otherwise puts a floor under the round-trip time of every command.
+    The timer is written through sysfs where the adapter exposes it, failing
+    that the port is flagged ASYNC_LOW_LATENCY, which the Linux USB serial
+    drivers also take as a request for the shortest timer. On Windows the
+    equivalent LatencyTimer setting is found within the adapter's advanced
+    port settings in the Device Manager.
+
+    Args:
+        dev: The newly opened Serial instance.
+
+    Returns:
+        None, the timer is left unchanged if it cannot be lowered, such as on
+            other platforms, for adapters without a latency timer, or without
+            the permissions to do so.
+
+    Raises:
+        None.
+    """
+    path = "/sys/bus/usb-serial/devices/{}/latency_timer"
+    try:
+        with open(path.format(basename(realpath(dev.port))), "w") as f:
+            f.write("1")
+        return
+    except OSError:
+        pass
+
+    # pyserial sets the flag through the TIOCGSERIAL and TIOCSSERIAL ioctls,
+    # this method only exists on its posix Serial class.
+    try:
+        dev.set_low_latency_mode(True)
+    except (AttributeError, OSError, ValueError):
+        pass
+
+
+def _read_exactly(dev: Serial, size: int, timeout: float = 2.0) -> bytes:
+    """ Read a given number of bytes from the multimeter.
+
+    A single read returns whatever has arrived once the port times out, which
+    for a long response may be only part of it, so reads are repeated until
+    all of the bytes have arrived or the overall timeout has passed.
+
+    Args:
+        dev: The open Serial instance to read from.
+
+        size: The number of bytes to read.
 
-def _read_double(input_bytes: bytes, offset: int) -> float:
+        timeout: The overall time limit in seconds, after which the bytes read
+            so far are returned.
 
-    if offset > 0:
-        endian_l = input_bytes[offset + 3:offset - 1:-1]
-    else:
-        endian_l = input_bytes[offset + 3::-1]
+    Returns:
+        The bytes read, of the given size unless the time limit was reached.
 
-    endian_h = input_bytes[offset + 7:offset + 3:-1]
-    endian = endian_l + endian_h
+    Raises:
+        None.
+    """
+    buf = bytearray()
+    deadline = monotonic() + timeout
+    while (len(buf) < size) and (monotonic() < deadline):
+        buf += dev.read(size - len(buf))
 
-    return round(unpack('!d', endian)[0], 8)
+    return bytes(buf)
 
 
-def _read_u16(input_bytes: bytes, offset: int) -> int:
+def _record_tables(map: Dict[str, Any]) -> Tuple[Any, Any, Any, Any]:
+    """ Pick out the tables used to interpret a binary reading.
 
-    if offset > 0:
-        endian: bytes = input_bytes[offset + 1:offset - 1:-1]
-    else:
-        endian: bytes = input_bytes[offset + 1::-1]
+    Args:
+        map: The multimeter parameter lookup tables (Fluke289._map_lut).
 
-    return int(unpack('!H', endian)[0])  # type: ignore
+    Returns:
+        The READINGID, UNIT, STATE and ATTRIBUTE tables, in that order.
 
+    Raises:
+        KeyError if any of the tables is missing from the map.
+    """
+    return (map["READINGID"], map["UNIT"], map["STATE"], map["ATTRIBUTE"])
 
-def _read_i16(input_bytes: bytes, offset: int) -> int:
-    val = _read_u16(input_bytes, offset)
 
-    if ((val & 0x8000) != 0):
-        val = -(0x10000 - val)
-    return val
+def _join_double(high: bytes, low: bytes) -> float:
+    return _DOUBLE.unpack(low + high)[0]
 
 
 if __name__ == "__main__":